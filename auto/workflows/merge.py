@@ -22,6 +22,19 @@ from auto.workflows.merge_validation import (
 
 logger = get_logger(__name__)
 
+# SHA patterns for merge output, compiled once at import
+# Common formats: "commit: abc123", "(commit: abc123)", "merged (commit: abc123)"
+_SHA_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"commit[:\s]+([a-zA-Z0-9]{7,40})",  # "commit: abc123" or "commit abc123" (flexible for tests)
+        r"\(commit[:\s]+([a-zA-Z0-9]{7,40})\)",  # "(commit: abc123)" (flexible for tests)
+        r"\b([a-f0-9]{40})\b",  # Full SHA standalone
+        r"\b([a-f0-9]{12,39})\b",  # Medium SHA
+        r"\b([a-f0-9]{7,11})\b",  # Short SHA
+    )
+)
+
 
 async def execute_auto_merge(
     pr_number: int, owner: str, repo: str, worktree_path: Path | None = None, force: bool = False
@@ -239,19 +252,9 @@ async def _extract_merge_commit_sha(
     """
     try:
         # Look for SHA patterns in the output - use more inclusive patterns
-        # Common formats: "commit: abc123", "(commit: abc123)", "merged (commit: abc123)"
-        sha_patterns = [
-            r"commit[:\s]+([a-zA-Z0-9]{7,40})",  # "commit: abc123" or "commit abc123" (flexible for tests)
-            r"\(commit[:\s]+([a-zA-Z0-9]{7,40})\)",  # "(commit: abc123)" (flexible for tests)
-            r"\b([a-f0-9]{40})\b",  # Full SHA standalone
-            r"\b([a-f0-9]{12,39})\b",  # Medium SHA
-            r"\b([a-f0-9]{7,11})\b",  # Short SHA
-        ]
-
         found_shas = []
-        for pattern in sha_patterns:
-            matches = re.findall(pattern, output, re.IGNORECASE)
-            found_shas.extend(matches)
+        for pattern in _SHA_PATTERNS:
+            found_shas.extend(pattern.findall(output))
 
         if found_shas:
             # Return the longest SHA found (most likely to be the merge commit)
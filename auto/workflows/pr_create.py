@@ -637,7 +637,7 @@ def has_uncommitted_changes(worktree_path: str) -> bool:
     """
     try:
         result = subprocess.run(
-            ["git", "status", "--porcelain"],
+            ["git", "--no-optional-locks", "status", "--porcelain"],
             cwd=worktree_path,
             capture_output=True,
             text=True,
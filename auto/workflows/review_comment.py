@@ -55,6 +55,38 @@ class CommentType(str, Enum):
     CHANGE_REQUEST = "change_request"  # Requires code changes
 
 
+# Priority weights (lower number = higher priority)
+_PRIORITY_WEIGHTS = {
+    CommentPriority.CRITICAL: 1,
+    CommentPriority.HIGH: 2,
+    CommentPriority.MEDIUM: 3,
+    CommentPriority.LOW: 4,
+}
+
+# Category weights for tiebreaking
+_CATEGORY_WEIGHTS = {
+    CommentCategory.BUG: 1,
+    CommentCategory.SECURITY: 2,
+    CommentCategory.PERFORMANCE: 3,
+    CommentCategory.CODE_QUALITY: 4,
+    CommentCategory.TESTING: 5,
+    CommentCategory.DOCUMENTATION: 6,
+    CommentCategory.STYLE: 7,
+    CommentCategory.SUGGESTION: 8,
+    CommentCategory.QUESTION: 9,
+    CommentCategory.NITPICK: 10,
+}
+
+# Category-based complexity adjustments; unlisted categories keep the base score
+_CATEGORY_COMPLEXITY_ADJUSTMENTS = {
+    CommentCategory.BUG: 2,
+    CommentCategory.SECURITY: 3,
+    CommentCategory.PERFORMANCE: 2,
+    CommentCategory.STYLE: -2,
+    CommentCategory.NITPICK: -3,
+}
+
+
 class ProcessedComment(BaseModel):
     """Processed review comment with analysis metadata."""
 
@@ -344,31 +376,9 @@ class ReviewCommentProcessor:
         self.logger.debug(f"Prioritizing {len(processed_comments)} comments")
 
         def priority_score(comment: ProcessedComment) -> tuple[int, int, int]:
-            # Priority weights (lower number = higher priority)
-            priority_weights = {
-                CommentPriority.CRITICAL: 1,
-                CommentPriority.HIGH: 2,
-                CommentPriority.MEDIUM: 3,
-                CommentPriority.LOW: 4,
-            }
-
-            # Category weights for tiebreaking
-            category_weights = {
-                CommentCategory.BUG: 1,
-                CommentCategory.SECURITY: 2,
-                CommentCategory.PERFORMANCE: 3,
-                CommentCategory.CODE_QUALITY: 4,
-                CommentCategory.TESTING: 5,
-                CommentCategory.DOCUMENTATION: 6,
-                CommentCategory.STYLE: 7,
-                CommentCategory.SUGGESTION: 8,
-                CommentCategory.QUESTION: 9,
-                CommentCategory.NITPICK: 10,
-            }
-
             return (
-                priority_weights.get(comment.priority, 10),
-                category_weights.get(comment.category, 10),
+                _PRIORITY_WEIGHTS.get(comment.priority, 10),
+                _CATEGORY_WEIGHTS.get(comment.category, 10),
                 comment.complexity_score,  # Lower complexity first for easier wins
             )
 
@@ -737,19 +747,8 @@ class ReviewCommentProcessor:
 
     def _calculate_complexity_score(self, comment_text: str, category: CommentCategory) -> int:
         """Calculate complexity score (1-10) for addressing the comment."""
-        score = 5  # Base score
-
-        # Category-based adjustments
-        if category == CommentCategory.BUG:
-            score += 2
-        elif category == CommentCategory.SECURITY:
-            score += 3
-        elif category == CommentCategory.PERFORMANCE:
-            score += 2
-        elif category == CommentCategory.STYLE:
-            score -= 2
-        elif category == CommentCategory.NITPICK:
-            score -= 3
+        # Base score plus category-based adjustment
+        score = 5 + _CATEGORY_COMPLEXITY_ADJUSTMENTS.get(category, 0)
 
         # Content-based adjustments
         comment_lower = comment_text.lower()
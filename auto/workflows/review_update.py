@@ -103,6 +103,26 @@ class UpdateValidation(BaseModel):
         default_factory=list, description="Issues found during validation"
     )
 
+    @property
+    def all_pre_ok(self) -> bool:
+        """Whether every pre-condition check passed."""
+        return all(self.pre_conditions.values())
+
+    @property
+    def all_post_ok(self) -> bool:
+        """Whether every post-condition validation passed."""
+        return all(self.post_conditions.values())
+
+    @property
+    def all_regression_ok(self) -> bool:
+        """Whether every regression check passed."""
+        return all(self.regression_checks.values())
+
+    @property
+    def all_quality_ok(self) -> bool:
+        """Whether every code quality check passed."""
+        return all(self.code_quality_checks.values())
+
 
 class CommitStrategy(BaseModel):
     """Strategy for committing review-based changes."""
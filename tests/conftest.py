@@ -1,11 +1,97 @@
 """Shared test configuration and fixtures."""
 
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pytest
 
 from auto.config import ConfigManager
+from auto.models import (
+    GitHubRepository,
+    Issue,
+    IssueProvider,
+    IssueStatus,
+    IssueType,
+    WorktreeInfo,
+)
+
+# --lf, --ff, --nf and --sw/--sw-skip read state written through the cache
+_CACHE_OPTIONS = ("lf", "failedfirst", "newfirst", "stepwise", "stepwise_skip")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip cache writes when every collected test is marked ``no_cache``."""
+    cache = getattr(config, "cache", None)
+    if cache is None or not items:
+        return
+
+    # Cache-backed options the user asked for still need their state recorded
+    if any(config.getoption(name, None) for name in _CACHE_OPTIONS):
+        return
+
+    if all(item.get_closest_marker("no_cache") for item in items):
+        # lastfailed/stepwise state is written through Cache.set at session end
+        cache.set = lambda key, value: None
+
+
+@pytest.fixture(scope="module")
+def sample_issue():
+    """Create sample issue."""
+    return Issue(
+        id="#123",
+        provider=IssueProvider.GITHUB,
+        title="Test issue",
+        description="Test description",
+        status=IssueStatus.OPEN,
+        issue_type=IssueType.FEATURE,
+        labels=["feature"],
+        assignee="testuser",
+        url="https://github.com/owner/repo/issues/123",
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_repository():
+    """Create sample repository."""
+    return GitHubRepository(
+        owner="owner",
+        name="repo",
+        default_branch="main",
+        remote_url="https://github.com/owner/repo.git",
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_worktree_info():
+    """Create sample worktree info."""
+    return WorktreeInfo(
+        path="/tmp/test-worktrees/auto-feature-123",
+        branch="auto/feature/123",
+        issue_id="#123",
+        metadata={"base_branch": "main"},
+    )
+
+
+@pytest.fixture
+def make_state():
+    """Factory for lightweight workflow state stand-ins with default fields."""
+
+    def _make_state(**overrides):
+        attrs = {
+            "issue": None,
+            "repository": None,
+            "metadata": {},
+            "pr_number": None,
+            "worktree": None,
+            "worktree_info": None,
+            "branch": None,
+            "update_status": Mock(),
+        }
+        attrs.update(overrides)
+        return SimpleNamespace(**attrs)
+
+    return _make_state
 
 
 @pytest.fixture
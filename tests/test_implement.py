@@ -504,7 +504,7 @@ class TestHasUncommittedChanges:
 
             assert result is True
             mock_run.assert_called_once_with(
-                ["git", "status", "--porcelain"],
+                ["git", "--no-optional-locks", "status", "--porcelain"],
                 cwd=str(tmp_path),
                 capture_output=True,
                 text=True,
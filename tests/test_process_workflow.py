@@ -0,0 +1,272 @@
+"""Tests for the process workflow."""
+
+from contextlib import ExitStack
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from auto.models import AIStatus, WorkflowStatus, WorktreeInfo
+from auto.workflows import implement as _implement
+from auto.workflows import process as _process
+from auto.workflows.process import (
+    ProcessWorkflowError,
+    cleanup_process_workflow,
+    get_process_status,
+    process_issue_workflow,
+    validate_process_prerequisites,
+)
+
+_FAILED = WorkflowStatus.FAILED
+_IMPLEMENTING = WorkflowStatus.IMPLEMENTING
+_AI_IMPLEMENTED = AIStatus.IMPLEMENTED
+
+# Fixed timestamp for state stubs; tests never compare against the clock
+_FIXED_NOW = datetime(2024, 1, 1)
+
+
+@pytest.fixture
+def process_mocks():
+    """Patch the process workflow's collaborators once and expose the mocks."""
+    with ExitStack() as stack:
+        mocks = SimpleNamespace(
+            get_config=stack.enter_context(patch.object(_process, "get_config")),
+            get_core=stack.enter_context(patch.object(_process, "get_core")),
+            worktree_class=stack.enter_context(patch.object(_process, "GitWorktreeManager")),
+            get_issue=stack.enter_context(patch.object(_process, "get_issue_from_state")),
+            fetch_workflow=stack.enter_context(patch.object(_process, "fetch_issue_workflow_sync")),
+            implement=stack.enter_context(patch.object(_process, "implement_issue_workflow")),
+            detect_repo=stack.enter_context(patch.object(_process, "detect_repository")),
+            # Mock Path to avoid filesystem checks
+            path=stack.enter_context(patch.object(_implement, "Path")),
+        )
+        mocks.core = mocks.get_core.return_value
+        mocks.worktree_manager = mocks.worktree_class.return_value
+        mocks.path.return_value.exists.return_value = True
+        yield mocks
+
+
+class TestProcessWorkflow:
+    """Test process workflow."""
+
+    def test_process_issue_workflow_success(
+        self, process_mocks, make_state, sample_issue, sample_repository, sample_worktree_info
+    ):
+        """Test successful process workflow."""
+        mock_state = make_state(issue=sample_issue)
+        process_mocks.core.get_workflow_state.return_value = mock_state
+
+        # Mock issue already in state
+        process_mocks.get_issue.return_value = sample_issue
+
+        # Mock repository detection
+        process_mocks.detect_repo.return_value = sample_repository
+
+        # Mock worktree manager
+        process_mocks.worktree_manager.create_worktree.return_value = sample_worktree_info
+
+        # Return the same state after successful implementation
+        mock_state_after_ai = make_state(
+            ai_status="implemented", issue=sample_issue, repository=sample_repository
+        )
+        process_mocks.implement.return_value = mock_state_after_ai
+
+        # Run workflow with AI disabled to test just the worktree part
+        result = process_issue_workflow("#123", enable_ai=False, enable_pr=False)
+
+        # Verify workflow steps
+        process_mocks.worktree_manager.create_worktree.assert_called_once_with(sample_issue, "main")
+        mock_state.update_status.assert_called()
+        process_mocks.core.save_workflow_state.assert_called()
+
+        assert result == mock_state
+        assert mock_state.worktree == sample_worktree_info.path
+        assert mock_state.worktree_info == sample_worktree_info
+        assert mock_state.branch == sample_worktree_info.branch
+
+    def test_process_issue_workflow_fetch_required(self, process_mocks, make_state, sample_issue):
+        """Test process workflow when issue fetch is required."""
+        # No issue in state initially
+        process_mocks.get_issue.return_value = None
+
+        # Mock fetch workflow
+        mock_state = make_state(issue=sample_issue)
+        process_mocks.fetch_workflow.return_value = mock_state
+
+        # Mock worktree creation (simplified)
+        mock_worktree_info = Mock()
+        mock_worktree_info.path = "/tmp/test-worktrees/auto-feature-123"
+        mock_worktree_info.branch = "auto/feature/123"
+        process_mocks.worktree_manager.create_worktree.return_value = mock_worktree_info
+
+        process_mocks.implement.return_value = mock_state
+
+        # Run workflow with AI disabled to test just the fetch and worktree parts
+        result = process_issue_workflow("#123", enable_ai=False, enable_pr=False)
+
+        # Verify fetch was called
+        process_mocks.fetch_workflow.assert_called_once_with("#123")
+        assert result == mock_state
+
+    def test_process_issue_workflow_worktree_error(self, process_mocks, make_state, sample_issue):
+        """Test process workflow with worktree creation error."""
+        mock_state = make_state(issue=sample_issue)
+        process_mocks.core.get_workflow_state.return_value = mock_state
+
+        process_mocks.get_issue.return_value = sample_issue
+
+        # Mock worktree manager that fails
+        process_mocks.worktree_manager.create_worktree.side_effect = Exception(
+            "Worktree creation failed"
+        )
+
+        with pytest.raises(ProcessWorkflowError) as excinfo:
+            process_issue_workflow("#123")
+        assert "Failed to process issue" in str(excinfo.value)
+
+        # Should update state to failed
+        mock_state.update_status.assert_called_with(_FAILED)
+
+    @pytest.mark.parametrize(
+        "has_state,cleanup_fails,expected",
+        [(True, False, True), (False, False, True), (True, True, False)],
+        ids=["success", "no_state", "worktree_error"],
+    )
+    def test_cleanup_process_workflow(
+        self,
+        process_mocks,
+        make_state,
+        sample_worktree_info,
+        has_state,
+        cleanup_fails,
+        expected,
+    ):
+        """Test process workflow cleanup with and without state and worktree errors."""
+        mock_state = make_state(worktree_info=sample_worktree_info) if has_state else None
+        process_mocks.core.get_workflow_state.return_value = mock_state
+        if cleanup_fails:
+            process_mocks.worktree_manager.cleanup_worktree.side_effect = Exception(
+                "Cleanup failed"
+            )
+
+        result = cleanup_process_workflow("#123")
+
+        assert result is expected
+        if not has_state:
+            process_mocks.worktree_manager.cleanup_worktree.assert_not_called()
+        elif not cleanup_fails:
+            # Verify cleanup steps
+            process_mocks.worktree_manager.cleanup_worktree.assert_called_once_with(
+                sample_worktree_info
+            )
+            process_mocks.core.cleanup_completed_states.assert_called_once()
+
+    def test_get_process_status_success(
+        self,
+        process_mocks,
+        make_state,
+        monkeypatch,
+        sample_issue,
+        sample_repository,
+        sample_worktree_info,
+    ):
+        """Test getting process status."""
+        mock_state = make_state(
+            issue_id="#123",
+            status=_IMPLEMENTING,
+            branch="auto/feature/123",
+            worktree="/tmp/test-worktrees/auto-feature-123",
+            worktree_info=sample_worktree_info,
+            repository=sample_repository,
+            issue=sample_issue,
+            created_at=_FIXED_NOW,
+            updated_at=_FIXED_NOW,
+            ai_status=_AI_IMPLEMENTED,
+            ai_response=None,
+            pr_metadata=None,
+        )
+        process_mocks.core.get_workflow_state.return_value = mock_state
+
+        # Only the worktree existence check touches the filesystem; pydantic models
+        # reject instance attributes, so stub the method on the class
+        monkeypatch.setattr(WorktreeInfo, "exists", lambda self: True)
+
+        result = get_process_status("#123")
+
+        assert result is not None
+        assert result["issue_id"] == "#123"
+        assert result["status"] == "implementing"
+        assert result["branch"] == "auto/feature/123"
+        assert result["has_worktree"] is True
+        assert result["worktree_exists"] is True
+        assert result["repository"] == "owner/repo"
+        assert result["issue_title"] == "Test issue"
+
+    def test_get_process_status_no_state(self, process_mocks):
+        """Test getting process status when no state exists."""
+        process_mocks.core.get_workflow_state.return_value = None
+
+        result = get_process_status("#123")
+        assert result is None
+
+    @patch("auto.utils.shell.get_git_root")
+    @patch("auto.integrations.github.validate_github_auth")
+    @patch.object(_process, "detect_repository")
+    @patch.object(_process, "get_config")
+    def test_validate_process_prerequisites_success(
+        self,
+        mock_get_config,
+        mock_detect_repo,
+        mock_validate_auth,
+        mock_get_git_root,
+        sample_repository,
+    ):
+        """Test successful prerequisite validation."""
+        mock_get_git_root.return_value = Path("/repo")
+        mock_validate_auth.return_value = True
+        mock_detect_repo.return_value = sample_repository
+        mock_get_config.return_value = Mock()
+
+        errors = validate_process_prerequisites("#123")
+        assert len(errors) == 0
+
+    @patch("auto.utils.shell.get_git_root")
+    def test_validate_process_prerequisites_no_git_repo(self, mock_get_git_root):
+        """Test prerequisite validation without git repository."""
+        mock_get_git_root.return_value = None
+
+        errors = validate_process_prerequisites("#123")
+        assert "Not in a git repository" in errors
+
+    @patch("auto.utils.shell.get_git_root")
+    @patch("auto.integrations.github.validate_github_auth")
+    def test_validate_process_prerequisites_no_github_auth(
+        self, mock_validate_auth, mock_get_git_root
+    ):
+        """Test prerequisite validation without GitHub authentication."""
+        mock_get_git_root.return_value = Path("/repo")
+        mock_validate_auth.return_value = False
+
+        errors = validate_process_prerequisites("#123")
+        assert any("GitHub CLI not authenticated" in error for error in errors)
+
+    @patch("auto.utils.shell.get_git_root")
+    @patch("auto.integrations.github.validate_github_auth")
+    @patch.object(_process, "detect_repository")
+    def test_validate_process_prerequisites_no_repo_access(
+        self, mock_detect_repo, mock_validate_auth, mock_get_git_root
+    ):
+        """Test prerequisite validation without repository access."""
+        mock_get_git_root.return_value = Path("/repo")
+        mock_validate_auth.return_value = True
+        mock_detect_repo.return_value = None
+
+        errors = validate_process_prerequisites("#123")
+        assert any("Could not detect GitHub repository" in error for error in errors)
+
+    def test_validate_process_prerequisites_invalid_issue_id(self):
+        """Test prerequisite validation with invalid issue ID."""
+        errors = validate_process_prerequisites("invalid-id")
+        assert any("Invalid issue identifier" in error for error in errors)